@@ -6,23 +6,71 @@ Creates actual graphical dependency visualizations using NetworkX and matplotlib
 This demonstrates real chart/graph output vs text-based visualizations.
 """
 
+from __future__ import annotations
+
 import sys
 import json
+import argparse
+import hashlib
+import importlib.util
+import multiprocessing
+import shutil
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
-
-# Set matplotlib backend before importing pyplot
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# matplotlib, networkx and numpy are imported inside the functions
+# that need them, so the cache-hit path never pays for importing them
+
+# orjson parses large exports several times faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads  # Also accepts bytes
+
+# Content-addressed cache of rendered PNGs, keyed by the input JSON bytes.
+# Bump RENDER_CACHE_VERSION whenever the rendering output changes.
+RENDER_CACHE_DIR = Path(".viz_cache")
+RENDER_CACHE_VERSION = b"v6"
+
+# Analysis files above this size are streamed with ijson instead of loaded
+STREAMING_THRESHOLD = 50 * 1024 * 1024
+
+# Larger graphs are pruned to their most important nodes before layout
+MAX_NODES = 500
+
+# Only the most important nodes get a text label
+MAX_LABELS = 50
+
+# Background render processes started by visualize_dependency_graph
+_pending_renders: List[multiprocessing.process.BaseProcess] = []
+
+def _import_pyplot():
+    """Import pyplot with the non-interactive backend selected"""
+    # Set matplotlib backend before importing pyplot
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
+
+def render_cache_path(analysis_file: str) -> Path:
+    """Get the cache location of the rendered graph for an analysis file"""
+    digest = hashlib.sha256(RENDER_CACHE_VERSION)
+    with open(analysis_file, 'rb') as f:
+        # Hash in chunks so large exports are never held in memory whole
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    key = digest.hexdigest()[:16]
+    return RENDER_CACHE_DIR / f"dependency_graph_{key}.png"
 
 def load_analysis_data(analysis_file: str) -> Dict[str, Any]:
     """Load analysis data from CodeHUD export"""
     try:
-        with open(analysis_file, 'r') as f:
-            data = json.load(f)
+        with open(analysis_file, 'rb') as f:
+            data = _loads(f.read())
         return data
     except Exception as e:
         print(f"Error loading analysis data: {e}")
@@ -30,47 +78,85 @@ def load_analysis_data(analysis_file: str) -> Dict[str, Any]:
 
 def extract_dependencies(analysis_data: Dict[str, Any]) -> List[Tuple[str, str]]:
     """Extract dependency relationships from analysis data"""
-    dependencies = []
-
     # Look for dependency data in different possible locations
     content = analysis_data.get('content', {})
 
     # Check Dependencies section
-    deps_section = content.get('Dependencies', {})
-    if deps_section:
-        # Look for dependency graph data
-        dep_graph = deps_section.get('dependency_graph', {})
-        nodes = dep_graph.get('nodes', [])
-        edges = dep_graph.get('edges', [])
-
-        # Add edges as dependencies
-        for edge in edges:
-            if isinstance(edge, list) and len(edge) >= 2:
-                dependencies.append((edge[0], edge[1]))
-
-        # Look for coupling metrics
-        coupling_metrics = deps_section.get('coupling_metrics', [])
-        for metric in coupling_metrics:
-            if isinstance(metric, dict) and 'from' in metric and 'to' in metric:
-                dependencies.append((metric['from'], metric['to']))
+    deps_section = content.get('Dependencies') or {}
+    # Look for dependency graph data
+    edges = (deps_section.get('dependency_graph') or {}).get('edges', [])
+    # Look for coupling metrics
+    coupling_metrics = deps_section.get('coupling_metrics', [])
 
     # Check Topology section for additional dependencies
-    topology = content.get('Topology', {})
-    if topology:
-        coupling_metrics = topology.get('coupling_metrics', [])
-        for metric in coupling_metrics:
-            if isinstance(metric, dict) and 'from' in metric and 'to' in metric:
-                dependencies.append((metric['from'], metric['to']))
+    topology = content.get('Topology') or {}
+    topology_metrics = topology.get('coupling_metrics', [])
+
+    return _dependency_pairs(edges, coupling_metrics, topology_metrics)
+
+def extract_dependencies_streaming(analysis_file: str) -> Optional[List[Tuple[str, str]]]:
+    """Extract dependency relationships by streaming the file with ijson
+
+    Only the edge and coupling-metric arrays are materialized, so memory use
+    scales with the number of dependencies rather than the file size.
+    Returns None if the file can't be parsed.
+    """
+    import ijson
+    from ijson.common import ObjectBuilder
+
+    edges: List[Any] = []
+    coupling_metrics: List[Any] = []
+    topology_metrics: List[Any] = []
+    targets = {
+        'content.Dependencies.dependency_graph.edges.item': edges,
+        'content.Dependencies.coupling_metrics.item': coupling_metrics,
+        'content.Topology.coupling_metrics.item': topology_metrics,
+    }
+
+    try:
+        with open(analysis_file, 'rb') as f:
+            # Single pass over the file, building only items under the targets
+            builder = None
+            current = None
+            for prefix, event, value in ijson.parse(f):
+                if builder is None:
+                    if prefix in targets and event in ('start_map', 'start_array'):
+                        builder = ObjectBuilder()
+                        current = prefix
+                        builder.event(event, value)
+                    continue
+
+                builder.event(event, value)
+                if prefix == current and event in ('end_map', 'end_array'):
+                    targets[current].append(builder.value)
+                    builder = None
+    except Exception as e:
+        print(f"Error streaming analysis data: {e}")
+        return None
+
+    return _dependency_pairs(edges, coupling_metrics, topology_metrics)
 
-    return dependencies
+def _dependency_pairs(edges: List[Any], coupling_metrics: List[Any],
+                      topology_metrics: List[Any]) -> List[Tuple[str, str]]:
+    """Turn raw edge and coupling-metric entries into (from, to) pairs"""
+    # Add edges as dependencies
+    edges_out = [(e[0], e[1]) for e in edges if isinstance(e, (list, tuple)) and len(e) >= 2]
+    coupling_out = [(m['from'], m['to']) for m in coupling_metrics
+                    if isinstance(m, dict) and 'from' in m and 'to' in m]
+    topology_out = [(m['from'], m['to']) for m in topology_metrics
+                    if isinstance(m, dict) and 'from' in m and 'to' in m]
+
+    return edges_out + coupling_out + topology_out
 
 def create_dependency_graph(dependencies: List[Tuple[str, str]], analysis_data: Dict[str, Any]) -> nx.DiGraph:
     """Create NetworkX directed graph from dependencies"""
+    import networkx as nx
+
     G = nx.DiGraph()
 
-    # Add all nodes and edges
-    for source, target in dependencies:
-        G.add_edge(source, target)
+    # Add all nodes and edges in one batch. Dependencies and Topology often
+    # report the same pair, so drop duplicates first (keeping first-seen order)
+    G.add_edges_from(dict.fromkeys(dependencies))
 
     # If no dependencies found, create a sample graph for demonstration
     if len(dependencies) == 0:
@@ -87,133 +173,303 @@ def create_dependency_graph(dependencies: List[Tuple[str, str]], analysis_data:
             ("tests.py", "main.py"),
             ("tests.py", "api.py")
         ]
-        for source, target in sample_deps:
-            G.add_edge(source, target)
+        G.add_edges_from(sample_deps)
 
     return G
 
+def _sparse_pagerank(G: nx.DiGraph) -> Dict[str, float]:
+    """PageRank via the SciPy sparse solver"""
+    import networkx as nx
+
+    # Visualization only needs approximate importance, so loosen the tolerance
+    # and cap iterations on large graphs
+    max_iter = 50 if G.number_of_nodes() > 1000 else 100
+    # NetworkX < 3.0 exposes the sparse solver as pagerank_scipy; newer releases
+    # dispatch nx.pagerank to it directly
+    pagerank_scipy = getattr(nx, 'pagerank_scipy', nx.pagerank)
+    return pagerank_scipy(G, alpha=0.85, tol=1e-4, max_iter=max_iter)
+
 def calculate_node_importance(G: nx.DiGraph) -> Dict[str, float]:
     """Calculate importance metrics for nodes"""
+    import networkx as nx
+    import numpy as np
+
+    # Small graphs don't need the iterative PageRank solver
+    if G.number_of_nodes() <= 20:
+        return nx.degree_centrality(G)
+
     # Use multiple centrality measures
     try:
-        pagerank = nx.pagerank(G)
+        pagerank = _sparse_pagerank(G)
         in_degree = dict(G.in_degree())
         out_degree = dict(G.out_degree())
 
+        # Structure-of-arrays over a fixed node order
+        nodes = list(in_degree)
+        count = len(nodes)
+        pr = np.fromiter((pagerank.get(node, 0) for node in nodes), dtype=np.float64, count=count)
+        in_deg = np.fromiter(in_degree.values(), dtype=np.float64, count=count)
+        out_deg = np.fromiter((out_degree[node] for node in nodes), dtype=np.float64, count=count)
+
         # Combine metrics (normalize to 0-1)
-        max_in = max(in_degree.values()) if in_degree.values() else 1
-        max_out = max(out_degree.values()) if out_degree.values() else 1
-
-        importance = {}
-        for node in G.nodes():
-            # Weighted combination of metrics
-            score = (
-                pagerank.get(node, 0) * 0.4 +
-                (in_degree.get(node, 0) / max_in) * 0.3 +
-                (out_degree.get(node, 0) / max_out) * 0.3
-            )
-            importance[node] = score
+        max_in = max(in_deg.max(), 1) if count else 1
+        max_out = max(out_deg.max(), 1) if count else 1
 
+        # Weighted combination of metrics
+        scores = pr * 0.4 + (in_deg / max_in) * 0.3 + (out_deg / max_out) * 0.3
+        importance = dict(zip(nodes, scores.tolist()))
         return importance
     except:
         # Fallback: use degree centrality
         return nx.degree_centrality(G)
 
-def visualize_dependency_graph(G: nx.DiGraph, output_file: str = "dependency_graph.png"):
-    """Create and save dependency graph visualization"""
+def visualize_dependency_graph(G: nx.DiGraph, output_file: str = "dependency_graph.png",
+                               background: bool = False, fig=None):
+    """Create and save dependency graph visualization
+
+    Pass an existing Figure as fig to draw into it instead of creating one.
+    With background set, drawing and PNG encoding happen in a separate
+    process and the PNG exists only once wait_for_renders has returned True.
+    """
+    import networkx as nx
+    import numpy as np
+
+    # Calculate node importance on the full graph
+    importance = calculate_node_importance(G)
 
-    plt.figure(figsize=(16, 12))
-    plt.title("CodeHUD Dependency Graph Visualization", fontsize=16, fontweight='bold')
+    # Prune huge graphs to the top nodes by importance, beyond which the
+    # image is unreadable and layout/edge drawing dominate runtime
+    total_nodes = G.number_of_nodes()
+    if total_nodes > MAX_NODES:
+        top = sorted(importance, key=importance.get, reverse=True)[:MAX_NODES]
+        G = G.subgraph(top).copy()
+
+    node_list = list(G.nodes())
+    edge_list = list(G.edges())
+    num_nodes = len(node_list)
 
     # Calculate layout
-    if len(G.nodes()) > 50:
+    if num_nodes > 50:
         # Use faster layout for large graphs
         pos = nx.spring_layout(G, k=3, iterations=20)
     else:
         # Use better layout for smaller graphs
         pos = nx.spring_layout(G, k=2, iterations=50)
 
-    # Calculate node importance and sizes
-    importance = calculate_node_importance(G)
-    node_sizes = [max(300, importance.get(node, 0) * 2000) for node in G.nodes()]
+    # Size and color nodes by importance, in a single pass over the nodes
+    importance_arr = np.fromiter((importance.get(node, 0) for node in node_list),
+                                 dtype=np.float64, count=num_nodes)
+    node_sizes = np.maximum(300.0, importance_arr * 2000.0)
+    node_colors = importance_arr
+
+    # Positions as an (N, 2) array in node_list order and edges as index
+    # pairs into it, so edge geometry is a vectorized gather, not dict lookups
+    pos_arr = np.array([pos[node] for node in node_list], dtype=np.float64).reshape(-1, 2)
+    node_index = {node: i for i, node in enumerate(node_list)}
+    edge_index = np.array([(node_index[u], node_index[v]) for u, v in edge_list],
+                          dtype=np.intp).reshape(-1, 2)
+
+    # Edge thickness based on target node importance
+    edge_weights = importance_arr[edge_index[:, 1]] * 3 + 0.5
+
+    # Add labels (simplified for readability), only for the most important
+    # nodes since every label is its own Text artist
+    top_labels = sorted(node_list, key=importance.get, reverse=True)[:MAX_LABELS]
+    labels = {}
+    for node in top_labels:
+        # Simplify file names (cheaper than building a Path per node)
+        label = node.rpartition('/')[2] or node
+
+        # Truncate long names
+        if len(label) > 12:
+            label = label[:10] + '..'
+        labels[node] = label
+
+    # Add statistics text, derived from the node/edge counts alone (the sum of
+    # in-degrees is the edge count) rather than further graph traversals
+    num_edges = len(edge_list)
+    density = num_edges / (num_nodes * (num_nodes - 1)) if num_nodes > 1 else 0
+    stats_text = f"""Graph Statistics:
+Nodes: {num_nodes}
+Edges: {num_edges}
+Density: {density:.3f}
+Avg In-Degree: {num_edges / num_nodes:.1f}"""
+    if total_nodes > num_nodes:
+        stats_text += f"\nPruned: top {num_nodes} of {total_nodes} nodes"
+
+    # Everything the renderer needs, kept picklable for the worker process
+    spec = {
+        'graph': G,
+        'nodes': node_list,
+        'edge_index': edge_index,
+        'pos': pos_arr,
+        'node_sizes': node_sizes,
+        'node_colors': node_colors,
+        'edge_weights': edge_weights,
+        'labels': labels,
+        'stats_text': stats_text,
+    }
+
+    if not background or fig is not None:
+        # A Figure can't be handed to another process, so reuse it inline
+        _render_worker(spec, output_file, fig)
+    else:
+        # Overlap PNG encoding with whatever the caller does next
+        ctx = multiprocessing.get_context('spawn')
+        process = ctx.Process(target=_render_worker, args=(spec, output_file))
+        process.start()
+        _pending_renders.append(process)
 
-    # Color nodes by importance
-    node_colors = [importance.get(node, 0) for node in G.nodes()]
+    return output_file
+
+def _render_worker(spec: Dict[str, Any], output_file: str, fig=None):
+    """Draw a render spec and save it as a PNG
+
+    Draws into fig after clearing it when given, otherwise into a new
+    Figure that is closed once saved.
+    """
+    import networkx as nx
+    import numpy as np
+    from matplotlib.collections import LineCollection
+    plt = _import_pyplot()
+
+    G = spec['graph']
+    pos_arr = spec['pos']
+    edge_index = spec['edge_index']
+    pos = dict(zip(spec['nodes'], pos_arr))
+
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(16, 12))
+    else:
+        fig.clear()
+    ax = fig.add_subplot(111)
+    # Pre-plan the layout: graph axes on the left, colorbar in the right margin,
+    # so no tight_layout/bbox_inches='tight' pass is needed at save time
+    fig.subplots_adjust(left=0.02, right=0.92, top=0.95, bottom=0.02)
+    ax.set_title("CodeHUD Dependency Graph Visualization", fontsize=16, fontweight='bold')
 
     # Draw nodes
     nodes = nx.draw_networkx_nodes(
         G, pos,
-        node_size=node_sizes,
-        node_color=node_colors,
+        ax=ax,
+        nodelist=spec['nodes'],
+        node_size=spec['node_sizes'],
+        node_color=spec['node_colors'],
         cmap=plt.cm.Reds,
         alpha=0.8,
         edgecolors='black',
         linewidths=1
     )
 
-    # Draw edges with varying thickness based on importance
-    edge_weights = []
-    for source, target in G.edges():
-        # Edge weight based on target node importance
-        weight = importance.get(target, 0) * 3 + 0.5
-        edge_weights.append(weight)
-
-    nx.draw_networkx_edges(
-        G, pos,
-        width=edge_weights,
-        alpha=0.6,
-        edge_color='gray',
-        arrowsize=20,
-        arrowstyle='->'
-    )
-
-    # Add labels (simplified for readability)
-    labels = {}
-    for node in G.nodes():
-        # Simplify file names
-        if '/' in node:
-            label = Path(node).name
-        else:
-            label = node
-
-        # Truncate long names
-        if len(label) > 12:
-            label = label[:10] + '..'
-        labels[node] = label
-
-    nx.draw_networkx_labels(
-        G, pos,
-        labels=labels,
-        font_size=8,
-        font_weight='bold'
-    )
-
-    # Add statistics text
-    stats_text = f"""Graph Statistics:
-Nodes: {G.number_of_nodes()}
-Edges: {G.number_of_edges()}
-Density: {nx.density(G):.3f}
-Avg In-Degree: {sum(dict(G.in_degree()).values()) / G.number_of_nodes():.1f}"""
-
-    plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes,
-             verticalalignment='top', fontsize=10,
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+    # Draw edges with varying thickness based on importance. A single
+    # LineCollection plus a single quiver for the arrowheads replaces one
+    # FancyArrowPatch artist per edge.
+    if len(edge_index):
+        starts = pos_arr[edge_index[:, 0]]
+        ends = pos_arr[edge_index[:, 1]]
+        segments = np.stack([starts, ends], axis=1)
+        ax.add_collection(LineCollection(
+            segments,
+            linewidths=spec['edge_weights'],
+            colors='gray',
+            alpha=0.6,
+            zorder=1
+        ))
+
+        # Direction arrowheads at edge midpoints, clear of the node markers
+        vectors = ends - starts
+        lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.maximum(lengths, 1e-9) * 0.02
+        midpoints = (starts + ends) / 2
+        ax.quiver(
+            midpoints[:, 0], midpoints[:, 1], vectors[:, 0], vectors[:, 1],
+            angles='xy', scale_units='xy', scale=1, pivot='mid',
+            color='gray', alpha=0.6, width=0.0015, headwidth=5, headlength=6,
+            zorder=1
+        )
+        ax.autoscale_view()
+
+    for node, label in spec['labels'].items():
+        x, y = pos[node]
+        ax.text(x, y, label, fontsize=8, fontweight='bold',
+                horizontalalignment='center', verticalalignment='center')
+
+    ax.text(0.02, 0.98, spec['stats_text'], transform=ax.transAxes,
+            verticalalignment='top', fontsize=10,
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
     # Add colorbar
     if nodes:
-        cbar = plt.colorbar(nodes, shrink=0.8)
+        cax = fig.add_axes([0.93, 0.12, 0.015, 0.76])
+        cbar = fig.colorbar(nodes, cax=cax)
         cbar.set_label('Node Importance', rotation=270, labelpad=20)
 
-    plt.axis('off')
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()  # Close instead of show for headless
+    ax.axis('off')
+    fig.savefig(output_file, dpi=150)
+    if owns_fig:
+        plt.close(fig)  # Close instead of show for headless
 
     print(f"✅ Dependency graph saved to {output_file}")
-    return output_file
+
+def wait_for_renders() -> bool:
+    """Block until all background renders have finished
+
+    Returns True if every render process exited cleanly.
+    """
+    ok = True
+    while _pending_renders:
+        process = _pending_renders.pop(0)
+        process.join()
+        ok = ok and process.exitcode == 0
+    return ok
+
+def render_many(json_files: List[str]) -> Tuple[List[str], List[str]]:
+    """Render one PNG per analysis file, reusing a single Figure
+
+    Each PNG is written next to its JSON file. Sharing the Figure amortizes
+    matplotlib figure setup and font cache warm-up across the batch.
+    Files that fail to load or contain no dependencies are skipped rather
+    than rendered as the demo graph.
+
+    Returns (output_files, failed_files).
+    """
+    plt = _import_pyplot()
+
+    fig = plt.figure(figsize=(16, 12))
+    output_files = []
+    failed_files = []
+    try:
+        for json_file in json_files:
+            print(f"📁 Rendering {json_file}")
+            analysis_data = load_analysis_data(json_file)
+            dependencies = extract_dependencies(analysis_data)
+            if not dependencies:
+                print(f"⚠️ No dependencies found in {json_file}, skipping")
+                failed_files.append(json_file)
+                continue
+
+            G = create_dependency_graph(dependencies, analysis_data)
+            output_file = str(Path(json_file).with_suffix('.png'))
+            output_files.append(visualize_dependency_graph(G, output_file, fig=fig))
+    finally:
+        plt.close(fig)
+    return output_files, failed_files
 
 def main():
     """Main visualization function"""
+    parser = argparse.ArgumentParser(description="CodeHUD Dependency Graph Visualizer")
+    parser.add_argument('files', nargs='*',
+                        help="Analysis JSON files to render in batch, one PNG per file")
+    args = parser.parse_args()
+
+    if args.files:
+        _, failed_files = render_many(args.files)
+        if failed_files:
+            print(f"❌ Failed to render: {', '.join(failed_files)}")
+            sys.exit(1)
+        return
+
     print("🔍 CodeHUD Dependency Graph Visualizer")
     print("=" * 50)
 
@@ -226,27 +482,48 @@ def main():
     ]
 
     analysis_data = {}
+    dependencies = None
     data_file = None
+    cache_path = None
+    output_file = "dependency_graph.png"
 
     for file_path in possible_files:
         if Path(file_path).exists():
-            print(f"📁 Loading analysis data from {file_path}")
-            analysis_data = load_analysis_data(file_path)
+            cache_path = render_cache_path(file_path)
+            if cache_path.exists():
+                # Input unchanged since the last render, skip the whole pipeline
+                shutil.copy(cache_path, output_file)
+                print(f"♻️ {file_path} unchanged, reusing cached render {cache_path}")
+                print(f"📊 Generated: {output_file}")
+                return
+
+            if (Path(file_path).stat().st_size > STREAMING_THRESHOLD
+                    and importlib.util.find_spec('ijson') is not None):
+                # Too large to load whole, stream just the dependency arrays
+                print(f"📁 Streaming dependencies from {file_path}")
+                dependencies = extract_dependencies_streaming(file_path)
+            else:
+                print(f"📁 Loading analysis data from {file_path}")
+                analysis_data = load_analysis_data(file_path)
             data_file = file_path
             break
 
-    if not analysis_data:
+    if not analysis_data and dependencies is None:
         print("⚠️ No analysis data found. Run CodeHUD export first:")
         print("   cargo run -- export-viz .")
         print("\n🔄 Creating demo visualization with sample data...")
         analysis_data = {"content": {}}  # Empty data for demo
+        cache_path = None  # Never cache the demo graph
     else:
         print(f"✅ Loaded analysis data from {data_file}")
 
     # Extract dependencies
     print("\n🔗 Extracting dependency relationships...")
-    dependencies = extract_dependencies(analysis_data)
+    if dependencies is None:
+        dependencies = extract_dependencies(analysis_data)
     print(f"   Found {len(dependencies)} dependency relationships")
+    if not dependencies:
+        cache_path = None  # Rendered as the demo graph, which is never cached
 
     # Create graph
     print("\n📊 Building dependency graph...")
@@ -255,7 +532,11 @@ def main():
 
     # Create visualization
     print("\n🎨 Creating visualization...")
-    output_file = visualize_dependency_graph(G)
+    output_file = visualize_dependency_graph(G, output_file)
+
+    if cache_path is not None:
+        RENDER_CACHE_DIR.mkdir(exist_ok=True)
+        shutil.copy(output_file, cache_path)
 
     print("\n" + "=" * 50)
     print("🎯 Visualization Complete!")
@@ -263,13 +544,11 @@ def main():
     print("🔍 This shows actual graphical charts vs text-based visualizations")
 
 if __name__ == "__main__":
-    # Check dependencies
-    try:
-        import matplotlib
-        import networkx
-        import numpy
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # Check dependencies without paying for importing them
+    missing = [name for name in ("matplotlib", "networkx", "numpy")
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Install with: pip install matplotlib networkx numpy")
         sys.exit(1)
 